@@ -30,6 +30,15 @@ from rf_monitor import RFMonitor
 import os
 from gps_module import GPSModule
 
+# Use uvloop's libuv-based event loop when available - it's a drop-in
+# replacement that cuts per-await overhead for the WebSocket broadcast path.
+# Not available on Windows, so fall back to the default loop there.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    uvloop = None
+
 # Initialize logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("rf_monitor_app")
@@ -130,6 +139,11 @@ DEVICE_EXPIRY_TIME = 3600  # 1 hour
 # Time of last cleanup
 last_cleanup_time = datetime.now()
 
+# Dirty flags for the debounced periodic save - set whenever the whitelist or
+# devices database is mutated so periodic_save only writes when something changed
+_whitelist_dirty = asyncio.Event()
+_devices_db_dirty = asyncio.Event()
+
 def load_whitelist():
     global whitelist
     try:
@@ -202,12 +216,13 @@ def verify_whitelist():
         logger.error(f"Error verifying whitelist: {e}")
 
 def save_whitelist():
+    """Write the whitelist to disk. Returns True only if a write landed."""
     try:
         # First write to a temporary file
         temp_file = f"{WHITELIST_FILE}.tmp"
         with open(temp_file, "w") as f:
             json.dump(whitelist, f, indent=2, cls=CustomJSONEncoder)
-        
+
         # Then rename the temporary file to the actual file
         # This helps prevent data corruption if the program crashes during writing
         if os.path.exists(temp_file):
@@ -215,10 +230,12 @@ def save_whitelist():
                 os.replace(temp_file, WHITELIST_FILE)
             else:
                 os.rename(temp_file, WHITELIST_FILE)
-            
+
             logger.info(f"Saved whitelist to {WHITELIST_FILE} with {len(whitelist)} devices")
+            return True
         else:
             logger.error(f"Failed to save whitelist: temporary file not created")
+            return False
     except Exception as e:
         logger.error(f"Error saving whitelist: {e}")
         # Try a direct save as a fallback
@@ -226,8 +243,10 @@ def save_whitelist():
             with open(WHITELIST_FILE, "w") as f:
                 json.dump(whitelist, f, cls=CustomJSONEncoder)
             logger.info(f"Saved whitelist directly to {WHITELIST_FILE} with {len(whitelist)} devices")
+            return True
         except Exception as e2:
             logger.error(f"Error in fallback whitelist save: {e2}")
+            return False
 
 def load_devices_db():
     global devices_db
@@ -244,12 +263,15 @@ def load_devices_db():
         devices_db = {}
 
 def save_devices_db():
+    """Write the devices database to disk. Returns True only on success."""
     try:
         with open(DEVICES_DB_FILE, "w") as f:
             json.dump(devices_db, f, cls=CustomJSONEncoder)
             logger.info(f"Saved devices database to {DEVICES_DB_FILE} with {len(devices_db)} devices")
+        return True
     except Exception as e:
         logger.error(f"Error saving devices database: {e}")
+        return False
 
 def cleanup_expired_devices():
     global devices_db, last_cleanup_time
@@ -340,6 +362,9 @@ def update_device_db(device):
             
             logger.debug(f"Updated device {device_id} in database")
         
+        # Mark the database dirty so the periodic save picks it up
+        _devices_db_dirty.set()
+
         # Save the updated database periodically
         # Don't save on every update to avoid excessive disk I/O
         now = datetime.now()
@@ -406,10 +431,11 @@ async def get_devices():
         # Run cleanup to remove expired devices
         cleanup_expired_devices()
         
-        # Capture RF data
-        samples = rf_monitor.capture_samples()
-        if samples is not None:
-            spectrum_data = rf_monitor.analyze_spectrum(samples)
+        # Capture RF data; the capture carries its own center frequency
+        capture = rf_monitor.capture_samples()
+        if capture is not None:
+            center_freq, samples = capture
+            spectrum_data = rf_monitor.analyze_spectrum(samples, center_freq)
             
             # Convert any NumPy types to Python native types to ensure JSON serialization works
             if spectrum_data and isinstance(spectrum_data, dict):
@@ -510,9 +536,9 @@ async def whitelist_device(device_id: str, device: Device):
             "whitelisted": True
         }
         
-        # Save whitelist to file after adding a device
-        save_whitelist()
-        
+        # Mark the whitelist dirty; the debounced periodic save persists it
+        _whitelist_dirty.set()
+
         # Create a backup of the whitelist for additional safety
         try:
             with open(f"{WHITELIST_FILE}.bak", "w") as f:
@@ -530,7 +556,7 @@ async def whitelist_device(device_id: str, device: Device):
             for key, value in whitelist[device_id].items():
                 if key not in devices_db[device_id] or key in ['name', 'type', 'whitelisted']:
                     devices_db[device_id][key] = value
-            save_devices_db()
+            _devices_db_dirty.set()
         
         logger.info(f"Device {device_id} added to whitelist")
         return {"status": "success", "message": f"Device {device_id} added to whitelist"}
@@ -544,14 +570,14 @@ async def remove_from_whitelist(device_id: str):
         if device_id in whitelist:
             # Remove from whitelist
             del whitelist[device_id]
-            
-            # Save whitelist to file after removing a device
-            save_whitelist()
-            
+
+            # Mark the whitelist dirty; the debounced periodic save persists it
+            _whitelist_dirty.set()
+
             # Update the device in devices_db if it exists
             if device_id in devices_db:
                 devices_db[device_id]["whitelisted"] = False
-                save_devices_db()
+                _devices_db_dirty.set()
             
             logger.info(f"Device {device_id} removed from whitelist")
             return {"status": "success", "message": f"Device {device_id} removed from whitelist"}
@@ -649,10 +675,11 @@ async def broadcast_data():
             update_spectrum = (current_time - _last_spectrum_time) >= _spectrum_update_interval
             
             if update_spectrum:
-                # Capture new RF data
-                samples = rf_monitor.capture_samples()  # Using optimized method with caching
-                if samples is not None:
-                    _last_spectrum_data = rf_monitor.analyze_spectrum(samples)
+                # Capture new RF data; the capture carries its own center frequency
+                capture = rf_monitor.capture_samples()
+                if capture is not None:
+                    center_freq, samples = capture
+                    _last_spectrum_data = rf_monitor.analyze_spectrum(samples, center_freq)
                     _last_spectrum_time = current_time
                     
             # Process spectrum data only if we have valid data
@@ -761,18 +788,42 @@ async def broadcast_data():
         await asyncio.sleep(sleep_time)
 
 async def periodic_save():
-    """Periodically save whitelist and devices database to ensure data persistence"""
+    """Save whitelist and devices database when they have actually changed.
+
+    Instead of unconditionally rewriting both files every 5 minutes, wait for
+    a dirty flag, then debounce briefly so bursts of mutations coalesce into
+    a single write. When the system is idle this does no disk I/O at all.
+    """
     while True:
         try:
-            # Save whitelist and devices_db every 5 minutes
-            save_whitelist()
-            save_devices_db()
+            waiters = [asyncio.create_task(_whitelist_dirty.wait()),
+                       asyncio.create_task(_devices_db_dirty.wait())]
+            done, pending = await asyncio.wait(
+                waiters, timeout=300, return_when=asyncio.FIRST_COMPLETED)
+            for task in pending:
+                task.cancel()
+            if not done:
+                # Nothing changed in the last 5 minutes - skip the save
+                continue
+
+            # Debounce: give a burst of mutations a moment to settle
+            await asyncio.sleep(5)
+
+            # Clear each flag *before* its save so a mutation landing
+            # mid-write re-arms it, and re-set the flag when the write
+            # fails so the next cycle retries instead of dropping data
+            if _whitelist_dirty.is_set():
+                _whitelist_dirty.clear()
+                if not save_whitelist():
+                    _whitelist_dirty.set()
+            if _devices_db_dirty.is_set():
+                _devices_db_dirty.clear()
+                if not save_devices_db():
+                    _devices_db_dirty.set()
             logger.info("Periodic save of whitelist and devices database completed")
         except Exception as e:
             logger.error(f"Error in periodic save: {e}")
-        
-        # Wait for 5 minutes
-        await asyncio.sleep(300)
+            await asyncio.sleep(5)
 
 @app.on_event("startup")
 async def startup_event():
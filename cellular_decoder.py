@@ -7,18 +7,25 @@ actual IMEIs from cellular devices using a HackRF One.
 
 import numpy as np
 from scipy import signal
+import re
 import subprocess
 import os
+import shutil
+import threading
 import time
 import logging
 import struct
 import tempfile
 from datetime import datetime
+from pathlib import Path
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("cellular_decoder")
 
+# Matches grgsm_decode identity responses that carry an IMEI
+_GSM_IMEI_RE = re.compile(r'IDENTITY RESPONSE.*IMEI:\s*(\d{15})')
+
 class CellularDecoder:
     """
     Advanced cellular protocol decoder for extracting device identifiers
@@ -47,26 +54,27 @@ class CellularDecoder:
         self.gain = gain
         self.temp_dir = tempfile.mkdtemp()
         logger.info(f"Initialized cellular decoder with sample rate {sample_rate/1e6} MHz")
-        
+
+        # Resolve tool paths once so per-capture command construction doesn't
+        # re-walk $PATH (and so the dependency check doesn't fork `which`)
+        self._hackrf_bin = shutil.which('hackrf_transfer') or 'hackrf_transfer'
+        self._grgsm_bin = shutil.which('grgsm_decode')
+        self._ltecs_bin = shutil.which('LTE-Cell-Scanner')
+
         # Verify required tools are available
         self._verify_dependencies()
-    
+
     def _verify_dependencies(self):
         """Verify that required dependencies are installed."""
-        try:
-            # Check for gr-gsm if we're going to decode GSM
-            result = subprocess.run(['which', 'grgsm_decode'], capture_output=True, text=True)
-            if result.returncode != 0:
-                logger.warning("gr-gsm tools not found. GSM decoding will be limited.")
-            
-            # Check for LTE Cell Scanner
-            result = subprocess.run(['which', 'LTE-Cell-Scanner'], capture_output=True, text=True)
-            if result.returncode != 0:
-                logger.warning("LTE-Cell-Scanner not found. LTE decoding will be limited.")
-                
-            logger.info("Dependency check completed")
-        except Exception as e:
-            logger.error(f"Error checking dependencies: {e}")
+        # Check for gr-gsm if we're going to decode GSM
+        if self._grgsm_bin is None:
+            logger.warning("gr-gsm tools not found. GSM decoding will be limited.")
+
+        # Check for LTE Cell Scanner
+        if self._ltecs_bin is None:
+            logger.warning("LTE-Cell-Scanner not found. LTE decoding will be limited.")
+
+        logger.info("Dependency check completed")
     
     def capture_and_decode(self, center_freq, duration=5, technology='auto'):
         """
@@ -94,20 +102,23 @@ class CellularDecoder:
                 technology = 'lte'  # Default to LTE for unknown bands
         
         # Capture samples using HackRF
-        samples = self._capture_samples(center_freq, duration)
+        samples, raw_path = self._capture_samples(center_freq, duration)
         if samples is None:
             return []
-        
-        # Decode based on technology
-        if technology == 'gsm':
-            return self._decode_gsm(samples, center_freq)
-        elif technology == 'umts':
-            return self._decode_umts(samples, center_freq)
-        elif technology == 'lte':
-            return self._decode_lte(samples, center_freq)
-        else:
-            logger.error(f"Unknown technology: {technology}")
-            return []
+
+        try:
+            # Decode based on technology
+            if technology == 'gsm':
+                return self._decode_gsm(samples, center_freq, raw_path)
+            elif technology == 'umts':
+                return self._decode_umts(samples, center_freq)
+            elif technology == 'lte':
+                return self._decode_lte(samples, center_freq, raw_path)
+            else:
+                logger.error(f"Unknown technology: {technology}")
+                return []
+        finally:
+            Path(raw_path).unlink(missing_ok=True)
     
     def _capture_samples(self, center_freq, duration):
         """
@@ -116,17 +127,20 @@ class CellularDecoder:
         Args:
             center_freq: Center frequency in Hz
             duration: Capture duration in seconds
-            
+
         Returns:
-            Numpy array of complex samples
+            Tuple of (complex64 sample array, path to the raw int8 capture
+            file) or (None, None) on failure. The caller owns the raw file
+            and must unlink it when done - keeping it around lets the
+            GSM/LTE decoders feed the untouched int8 I/Q data straight to
+            the external tools without a complex64 re-write.
         """
+        # Create temporary file for samples
+        samples_file = os.path.join(self.temp_dir, 'samples.bin')
         try:
-            # Create temporary file for samples
-            samples_file = os.path.join(self.temp_dir, 'samples.bin')
-            
             # Construct hackrf_transfer command with higher sample rate for better decoding
             cmd = [
-                'hackrf_transfer',
+                self._hackrf_bin,
                 '-r', samples_file,
                 '-f', str(int(center_freq)),
                 '-s', str(int(self.sample_rate)),
@@ -142,62 +156,66 @@ class CellularDecoder:
             
             if result.returncode != 0:
                 logger.error(f"hackrf_transfer failed: {result.stderr}")
-                return None
-            
+                return None, None
+
             # Check if file exists and has content
             if not os.path.exists(samples_file):
                 logger.error("Samples file was not created")
-                return None
-            
+                return None, None
+
             if os.path.getsize(samples_file) == 0:
                 logger.error("Samples file is empty")
-                return None
-            
+                Path(samples_file).unlink(missing_ok=True)
+                return None, None
+
             # Read the binary data
             with open(samples_file, 'rb') as f:
                 data = f.read()
-            
+
             # Convert to numpy array
             samples = np.frombuffer(data, dtype=np.int8)
-            
+
             # Convert to complex numbers (I/Q data)
             samples = samples[::2] + 1j * samples[1::2]
             samples = samples.astype(np.complex64)
-            
-            # Clean up
-            os.remove(samples_file)
-            
-            return samples
-            
+
+            return samples, samples_file
+
         except Exception as e:
             logger.error(f"Error capturing samples: {e}")
-            if os.path.exists(samples_file):
-                os.remove(samples_file)
-            return None
+            # Single unlink that swallows ENOENT instead of a stat+remove pair
+            Path(samples_file).unlink(missing_ok=True)
+            return None, None
     
-    def _decode_gsm(self, samples, center_freq):
+    def _decode_gsm(self, samples, center_freq, raw_path=None):
         """
         Decode GSM signals to extract IMEIs.
-        
+
         Args:
             samples: Complex samples
             center_freq: Center frequency in Hz
-            
+            raw_path: Path to the raw int8 capture file, if still on disk
+
         Returns:
             List of extracted IMEIs
         """
         logger.info("Decoding GSM signals")
         imeis = []
-        
-        try:
-            # Save samples to temporary file for gr-gsm processing
+
+        # Hand gr-gsm the untouched int8 capture when we have it - re-writing
+        # the complex64 copy quadruples the bytes written for no benefit
+        if raw_path is not None:
+            temp_file = raw_path
+            owns_temp = False
+        else:
             temp_file = os.path.join(self.temp_dir, 'gsm_samples.cfile')
             samples.tofile(temp_file)
-            
+            owns_temp = True
+        try:
             # Use gr-gsm to decode GSM bursts
             # This is a simplified example - actual implementation would use gr-gsm Python API
             cmd = [
-                'grgsm_decode',
+                self._grgsm_bin or 'grgsm_decode',
                 '-c', temp_file,
                 '-f', str(int(center_freq)),
                 '-s', str(int(self.sample_rate)),
@@ -205,28 +223,38 @@ class CellularDecoder:
             ]
             
             logger.info(f"Running: {' '.join(cmd)}")
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            
-            # Parse output for IMEI information
-            output = result.stdout
-            for line in output.split('\n'):
-                if "IDENTITY RESPONSE" in line and "IMEI" in line:
-                    # Extract IMEI from response
-                    parts = line.split("IMEI:")
-                    if len(parts) > 1:
-                        imei = parts[1].strip().split()[0]
+            # Stream stdout line by line instead of buffering the whole
+            # decode output and re-splitting it afterwards. A watchdog
+            # timer bounds the whole decode the way the old
+            # subprocess.run(timeout=30) did: if the tool wedges without
+            # closing stdout, the kill EOFs the read loop
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                                    stderr=subprocess.DEVNULL,
+                                    text=True, bufsize=1)
+            watchdog = threading.Timer(30, proc.kill)
+            watchdog.start()
+            try:
+                for line in proc.stdout:
+                    match = _GSM_IMEI_RE.search(line)
+                    if match:
+                        imei = match.group(1)
                         if self._validate_imei(imei):
                             imeis.append(imei)
                             logger.info(f"Found GSM IMEI: {imei}")
-            
-            # Clean up
-            os.remove(temp_file)
-            
+            finally:
+                watchdog.cancel()
+                try:
+                    proc.wait(timeout=30)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.wait()
+
         except Exception as e:
             logger.error(f"Error decoding GSM: {e}")
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
-        
+        finally:
+            if owns_temp:
+                Path(temp_file).unlink(missing_ok=True)
+
         return imeis
     
     def _decode_umts(self, samples, center_freq):
@@ -262,29 +290,34 @@ class CellularDecoder:
         
         return imeis
     
-    def _decode_lte(self, samples, center_freq):
+    def _decode_lte(self, samples, center_freq, raw_path=None):
         """
         Decode LTE signals to extract IMEIs.
-        
+
         Args:
             samples: Complex samples
             center_freq: Center frequency in Hz
-            
+            raw_path: Path to the raw int8 capture file, if still on disk
+
         Returns:
             List of extracted IMEIs
         """
         logger.info("Decoding LTE signals")
         imeis = []
-        
-        try:
-            # Save samples to temporary file for LTE-Cell-Scanner
+
+        # Prefer the untouched int8 capture over a complex64 re-write
+        if raw_path is not None:
+            temp_file = raw_path
+            owns_temp = False
+        else:
             temp_file = os.path.join(self.temp_dir, 'lte_samples.bin')
             samples.tofile(temp_file)
-            
+            owns_temp = True
+        try:
             # Use LTE-Cell-Scanner to identify cells
             # This is a simplified example - actual implementation would be more complex
             cmd = [
-                'LTE-Cell-Scanner',
+                self._ltecs_bin or 'LTE-Cell-Scanner',
                 '-i', temp_file,
                 '-s', str(int(self.sample_rate)),
                 '-f', str(int(center_freq/1e6))  # MHz
@@ -301,15 +334,13 @@ class CellularDecoder:
             
             # For demonstration, we'll log that this requires specialized processing
             logger.info("LTE IMEI extraction requires specialized signal processing")
-            
-            # Clean up
-            os.remove(temp_file)
-            
+
         except Exception as e:
             logger.error(f"Error decoding LTE: {e}")
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
-        
+        finally:
+            if owns_temp:
+                Path(temp_file).unlink(missing_ok=True)
+
         return imeis
     
     def _validate_imei(self, imei):
@@ -1,10 +1,142 @@
 import numpy as np
-from scipy import signal
-import json
+from scipy.ndimage import uniform_filter1d
+from functools import lru_cache
+import orjson
 from datetime import datetime
 import os
+import time
 import uuid
-import random
+import queue
+import hashlib
+import threading
+
+# Optional: numba JIT-compiles the fused burst-detection kernel. The
+# vectorized NumPy path below is used when it is not installed.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+def _detect_bursts_impl(energy, window_size, threshold_lin):
+    """Single-pass burst detection over an energy array.
+
+    Fuses the moving-average noise floor, threshold compare, and
+    rising-edge capture into one loop so no intermediate arrays are
+    materialized. The centered window uses zero padding at the array
+    edges, matching the original np.convolve 'same'-mode estimate; the
+    vectorized fallback uses uniform_filter1d with nearest-edge padding
+    instead, so the two paths can differ within half a window of either
+    end. Interior results agree up to floating-point rounding of the
+    incremental running sum. Compiled with numba when available.
+    """
+    n = energy.shape[0]
+    offset = (window_size - 1) // 2
+    starts = np.empty(n // 2 + 1, dtype=np.int64)
+    count = 0
+    # Seed the running window sum for position 0
+    running = 0.0
+    for j in range(min(window_size - offset, n)):
+        running += energy[j]
+    prev_above = False
+    for i in range(n):
+        # energy[i] > (running/W) * thr, rearranged to avoid the division
+        above = energy[i] * window_size > running * threshold_lin
+        if above and not prev_above and i > 0:
+            starts[count] = i
+            count += 1
+        prev_above = above
+        add = i + window_size - offset
+        if add < n:
+            running += energy[add]
+        sub = i - offset
+        if sub >= 0:
+            running -= energy[sub]
+    return starts[:count]
+
+
+if njit is not None:
+    _detect_bursts_kernel = njit(cache=True, fastmath=True)(_detect_bursts_impl)
+else:
+    _detect_bursts_kernel = None
+
+
+def _digits(rng, n):
+    """n random decimal digits as a string, drawn in one vectorized call.
+
+    Drawing ASCII codes directly and decoding the bytes avoids the
+    per-digit str()/join round-trip.
+    """
+    return rng.integers(48, 58, size=n, dtype=np.uint8).tobytes().decode()
+
+
+def _mag2(samples):
+    """Squared magnitude of complex samples without the sqrt of np.abs.
+
+    np.abs(x)**2 takes a square root and immediately squares it again;
+    real**2 + imag**2 gives the same energy array in two cheap multiplies.
+    """
+    return samples.real**2 + samples.imag**2
+
+
+# Doubled-digit table for the Luhn check: _LUHN_DOUBLE[d] == 2*d - 9*(2*d > 9),
+# so the per-digit double-and-fold becomes a branchless lookup
+_LUHN_DOUBLE = np.array((0, 2, 4, 6, 8, 1, 3, 5, 7, 9), dtype=np.int8)
+
+# Phone subtype label per technology
+_SUBTYPE_BY_TECH = {'LTE': 'LTE Phone', 'UMTS': 'UMTS Phone', 'GSM': 'GSM Phone'}
+
+# Carrier by Mobile Network Code, for labeling network equipment
+_MNC_TO_CARRIER = {
+    '020': 'AT&T', '070': 'AT&T', '090': 'AT&T',
+    '004': 'Verizon', '010': 'Verizon', '012': 'Verizon',
+    '260': 'T-Mobile', '240': 'T-Mobile', '250': 'T-Mobile',
+    '120': 'Sprint', '490': 'Sprint', '890': 'Sprint',
+}
+
+# TAC prefixes by manufacturer (first 5 digits of the 8-digit TAC)
+# These are approximations based on common TAC ranges
+_TAC_PREFIXES = {
+    'Apple': ['35325', '35391', '35407', '35501', '35502', '35503'],
+    'Samsung': ['35273', '35290', '35332', '35254', '35255', '35256'],
+    'Google': ['35851', '35852', '35853', '35854', '35855', '35856'],
+    'Motorola': ['35089', '35138', '35156', '35157', '35158', '35159'],
+    'LG': ['35201', '35202', '35203', '35204', '35205', '35206'],
+    'Nokia': ['35401', '35402', '35403', '35404', '35405', '35406'],
+    'Unknown': ['35999']
+}
+
+# Fallback manufacturer when a (tech, band) pair has no table entry
+_MFG_DEFAULT = {'GSM': 'Nokia'}
+
+
+def _build_mfg_table():
+    """Flatten the manufacturer heuristics into one lookup table.
+
+    Keyed on (tech, band); each entry is (low-PAPR manufacturer,
+    high-PAPR manufacturer, PAPR split point), so classification is a
+    single dict lookup plus one comparison instead of a nested branch
+    ladder per detection.
+    """
+    table = {}
+    # LTE international bands: high PAPR skews Samsung, otherwise Apple
+    for band in (1, 3, 7, 8):
+        table[('LTE', band)] = ('Apple', 'Samsung', 8.0)
+    # LTE US coverage bands: high PAPR skews Google, otherwise Apple
+    for band in (12, 13, 17):
+        table[('LTE', band)] = ('Apple', 'Google', 8.5)
+    # Common US LTE bands
+    for band in (2, 4, 5):
+        table[('LTE', band)] = ('Samsung', 'Samsung', 8.0)
+    # UMTS and GSM assignments are per-band only
+    for band, mfg in ((1, 'Nokia'), (2, 'Motorola'), (4, 'LG'), (5, 'Sony')):
+        table[('UMTS', band)] = (mfg, mfg, 8.0)
+    for band, mfg in ((1900, 'Motorola'), (850, 'LG')):
+        table[('GSM', band)] = (mfg, mfg, 8.0)
+    return table
+
+
+_MFG_TABLE = _build_mfg_table()
+
 
 class CellularDetector:
     GSM_FREQUENCIES = {
@@ -56,89 +188,177 @@ class CellularDetector:
         30: {'uplink': (2305e6, 2315e6), 'downlink': (2350e6, 2360e6)}
     }
 
+    # Burst detection threshold: 6 dB above the local noise floor,
+    # precomputed in linear scale so the hot loop skips the pow() call
+    _BURST_THRESHOLD_LIN = 10 ** (6.0 / 10)
+
     def __init__(self):
         self.known_devices = {}
+        # Typed structure-of-arrays index over known_devices: numeric columns
+        # for the per-detection similarity search so it runs as vectorized
+        # NumPy compares instead of walking Python dicts field by field
+        self._index_capacity = 64
+        self._index_count = 0
+        self._dev_freq = np.empty(self._index_capacity, dtype=np.float64)
+        self._dev_power = np.empty(self._index_capacity, dtype=np.float32)
+        self._dev_ids = []
+        self._index_pos = {}
+        # Debounce cache writes: mutations set a dirty flag and the file is
+        # rewritten at most once per throttle window instead of after every
+        # single detection
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        # Disk flushes run on a daemon writer thread so the analysis path
+        # never blocks on serialization or file I/O
+        self._flush_q = queue.Queue()
+        threading.Thread(target=self._writer_loop, daemon=True).start()
         self.load_cached_data()
+        self._rebuild_index()
+
+    def _rebuild_index(self):
+        """Rebuild the numeric similarity index from known_devices"""
+        ids, freqs, powers = [], [], []
+        for device_id, device in self.known_devices.items():
+            try:
+                freqs.append(float(device['frequency']))
+                powers.append(float(device['power']))
+                ids.append(device_id)
+            except (KeyError, TypeError, ValueError):
+                continue
+        self._index_count = len(ids)
+        self._index_capacity = max(64, 2 * self._index_count)
+        self._dev_freq = np.empty(self._index_capacity, dtype=np.float64)
+        self._dev_power = np.empty(self._index_capacity, dtype=np.float32)
+        self._dev_freq[:self._index_count] = freqs
+        self._dev_power[:self._index_count] = powers
+        self._dev_ids = ids
+        self._index_pos = {device_id: row for row, device_id in enumerate(ids)}
+
+    def _index_add(self, device_id, frequency, power):
+        """Append a device to the similarity index, doubling capacity on overflow"""
+        if self._index_count == self._index_capacity:
+            self._index_capacity *= 2
+            self._dev_freq = np.resize(self._dev_freq, self._index_capacity)
+            self._dev_power = np.resize(self._dev_power, self._index_capacity)
+        self._dev_freq[self._index_count] = frequency
+        self._dev_power[self._index_count] = power
+        self._dev_ids.append(device_id)
+        self._index_pos[device_id] = self._index_count
+        self._index_count += 1
+
+    def _index_update(self, device_id, frequency, power):
+        """Refresh a device's index row so the similarity window tracks
+        its most recent sighting instead of staying anchored to the first"""
+        row = self._index_pos.get(device_id)
+        if row is None:
+            self._index_add(device_id, frequency, power)
+            return
+        self._dev_freq[row] = frequency
+        self._dev_power[row] = power
+
+    def _find_similar_device(self, frequency, power):
+        """Vectorized lookup of a known device within 50 kHz / 5 dB"""
+        n = self._index_count
+        if n == 0:
+            return None
+        mask = (np.abs(self._dev_freq[:n] - frequency) < 50000) & \
+               (np.abs(self._dev_power[:n] - power) < 5)
+        matches = np.flatnonzero(mask)
+        if matches.size == 0:
+            return None
+        return self._dev_ids[int(matches[0])]
 
     def load_cached_data(self):
         """Load previously detected device data"""
         try:
             if os.path.exists('device_cache.json'):
-                with open('device_cache.json', 'r') as f:
-                    self.known_devices = json.load(f)
+                with open('device_cache.json', 'rb') as f:
+                    self.known_devices = orjson.loads(f.read())
         except Exception as e:
             print(f"Error loading device cache: {e}")
 
     def save_cached_data(self):
         """Save detected device data"""
+        # Clear the dirty flag *before* serializing so a detection that
+        # mutates known_devices mid-write re-arms it for the next flush;
+        # on failure re-set it so the write is retried rather than lost
+        self._dirty = False
         try:
-            # Convert any NumPy values to Python types before serialization
-            devices_copy = {}
-            for device_id, device_data in self.known_devices.items():
-                devices_copy[device_id] = {}
-                for key, value in device_data.items():
-                    if isinstance(value, np.integer):
-                        devices_copy[device_id][key] = int(value)
-                    elif isinstance(value, np.floating):
-                        devices_copy[device_id][key] = float(value)
-                    elif isinstance(value, np.ndarray):
-                        devices_copy[device_id][key] = value.tolist()
-                    else:
-                        devices_copy[device_id][key] = value
-            
-            # Save the converted data
-            with open('device_cache.json', 'w') as f:
-                json.dump(devices_copy, f)
+            # orjson serializes NumPy scalars/arrays natively, so no
+            # Python-level type conversion pass is needed; write to a temp
+            # file and os.replace so readers never see a partial cache
+            tmp_path = 'device_cache.json.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(self.known_devices,
+                                     option=orjson.OPT_SERIALIZE_NUMPY))
+            os.replace(tmp_path, 'device_cache.json')
+            self._last_flush = time.monotonic()
         except Exception as e:
+            self._dirty = True
             print(f"Error saving device cache: {e}")
 
+    def _writer_loop(self):
+        """Daemon thread that performs cache writes off the hot path"""
+        while True:
+            self._flush_q.get()
+            # Coalesce any flush requests that piled up while writing so a
+            # burst of detections still costs a single rewrite
+            while not self._flush_q.empty():
+                try:
+                    self._flush_q.get_nowait()
+                except queue.Empty:
+                    break
+            self.save_cached_data()
+
+    def _flush_if_due(self, min_interval=5.0):
+        """Queue a cache write only when dirty and the throttle window passed"""
+        if self._dirty and time.monotonic() - self._last_flush > min_interval:
+            self._flush_q.put(None)
+
     def is_cellular_frequency(self, freq_hz):
         """Check if a frequency falls within cellular bands (GSM, UMTS, or LTE)"""
         # Convert to Hz if in MHz
         if freq_hz < 10000:
             freq_hz *= 1e6
-        
-        # Check GSM bands (prioritize downlink as these are more likely to be phones)
-        for band, ranges in self.GSM_FREQUENCIES.items():
-            if ranges['downlink'][0] <= freq_hz <= ranges['downlink'][1]:
-                return True, 'GSM', band, 'downlink'
-            elif ranges['uplink'][0] <= freq_hz <= ranges['uplink'][1]:
-                return True, 'GSM', band, 'uplink'
-        
-        # Check UMTS bands
-        for band, ranges in self.UMTS_FREQUENCIES.items():
-            if ranges['downlink'][0] <= freq_hz <= ranges['downlink'][1]:
-                return True, 'UMTS', band, 'downlink'
-            elif ranges['uplink'][0] <= freq_hz <= ranges['uplink'][1]:
-                return True, 'UMTS', band, 'uplink'
-        
-        # Check LTE bands (prioritize downlink as these are more likely to be phones)
-        for band, ranges in self.LTE_BANDS.items():
-            if ranges['downlink'][0] <= freq_hz <= ranges['downlink'][1]:
-                return True, 'LTE', band, 'downlink'
-            elif ranges['uplink'][0] <= freq_hz <= ranges['uplink'][1]:
-                return True, 'LTE', band, 'uplink'
-        
-        return False, None, None, None
 
-    def detect_signal_bursts(self, samples, sample_rate):
+        # Scanners revisit the same channels constantly, so quantize to
+        # 1 kHz (finer than any band edge) and let the cached lookup turn
+        # repeat probes into a dict hit
+        return _cellular_lookup(int(freq_hz // 1000))
+
+    def detect_signal_bursts(self, samples, sample_rate, energy=None):
         """Detect signal bursts in the signal using energy detection"""
         # Typical burst duration in cellular systems can range from ~0.5 to 4ms
         burst_samples = int(1e-3 * sample_rate)  # 1ms window
-        
-        # Calculate signal energy
-        energy = np.abs(samples)**2
-        
-        # Moving average for noise floor estimation
+
+        # Calculate signal energy unless the caller already has it
+        if energy is None:
+            energy = _mag2(samples)
+
         window_size = min(burst_samples * 10, len(samples) // 10)
-        noise_floor = np.convolve(energy, np.ones(window_size)/window_size, mode='same')
-        
+
+        # Fused single-pass kernel (noise floor + threshold + edge capture)
+        # when numba is available
+        if _detect_bursts_kernel is not None:
+            burst_starts = _detect_bursts_kernel(energy, window_size,
+                                                 self._BURST_THRESHOLD_LIN)
+            return len(burst_starts), burst_starts
+
+        # Vectorized fallback: uniform_filter1d runs the sliding mean as an
+        # O(N) C loop regardless of window size, with no kernel allocation
+        # (nearest-edge padding rather than convolve's zero padding, which
+        # only perturbs the floor estimate within half a window of the ends)
+        noise_floor = uniform_filter1d(energy, size=window_size,
+                                       mode='nearest')
+
         # Detect bursts where energy is significantly above noise floor
-        threshold = 6.0  # 6 dB above noise floor
-        burst_mask = energy > (noise_floor * 10**(threshold/10))
+        burst_mask = energy > (noise_floor * self._BURST_THRESHOLD_LIN)
         
-        # Find burst start positions
-        burst_starts = np.where(np.diff(burst_mask.astype(int)) > 0)[0]
+        # Find burst start positions: rising edges are where the mask is set
+        # but its predecessor is not, done directly on the bool array rather
+        # than through an int64 astype/diff/where chain; +1 so the index
+        # points at the first above-threshold sample itself
+        burst_starts = np.flatnonzero(burst_mask[1:] & ~burst_mask[:-1]) + 1
         
         return len(burst_starts), burst_starts
 
@@ -150,38 +370,37 @@ class CellularDetector:
         if not is_cellular:
             return None
             
+        # Compute the signal energy once and derive every power figure from
+        # it; the same buffer feeds the burst detector below so the samples
+        # array is only traversed once
+        energy = _mag2(samples)
+        avg_energy = energy.mean()
+        avg_power = 10 * np.log10(avg_energy)
+
+        # Only process strong enough signals - rejecting here skips all of
+        # the classification work below, which is the common case when
+        # sweeping mostly-empty spectrum
+        if avg_power < -70:  # Adjust threshold as needed
+            return None
+
         # Get additional weighting based on frequency band and link type
         # Downlink channels are much more likely to be from cell phones
         detection_confidence = 0.7
         if link_type == 'downlink':
             detection_confidence += 0.2
-            
+
         # Certain bands are more commonly used by cell phones
         common_phone_bands = [850, 700, 1900, 2100]
         if band in common_phone_bands:
             detection_confidence += 0.1
-            
-        # Calculate average power in dB
-        avg_power = 10 * np.log10(np.mean(np.abs(samples)**2))
-        
-        # Only process strong enough signals
-        if avg_power < -70:  # Adjust threshold as needed
-            return None
-        
-        # Calculate max power in dB
-        max_power = 10 * np.log10(np.max(np.abs(samples)**2))
-        
-        # Perform FFT to check spectral characteristics
-        window = np.hamming(len(samples))
-        samples_windowed = samples * window
-        fft = np.fft.fftshift(np.fft.fft(samples_windowed))
-        power_spectrum = 10 * np.log10(np.abs(fft)**2)
-        
-        # Calculate peak-to-average power ratio (PAPR)
-        papr = max_power - avg_power
-        
-        # Detect bursts in the signal
-        burst_count, burst_positions = self.detect_signal_bursts(samples, sample_rate)
+
+        # Peak-to-average power ratio (PAPR): one log10 on the ratio instead
+        # of separate log calls for the average and the max
+        papr = 10 * np.log10(energy.max() / avg_energy)
+        max_power = avg_power + papr
+
+        # Detect bursts in the signal, reusing the energy buffer
+        burst_count, burst_positions = self.detect_signal_bursts(samples, sample_rate, energy)
         
         if burst_count < 3:  # Need minimum 3 bursts to consider it a valid cellular signal
             return None
@@ -193,17 +412,14 @@ class CellularDetector:
         power_factor = int(avg_power * 100) if avg_power else 0
         id_seed = f"{frequency_factor}-{burst_factor}-{power_factor}"
         
-        import hashlib
-        device_id = hashlib.md5(id_seed.encode()).hexdigest()[:8]
+        # blake2s is measurably faster than md5 and a 4-byte digest gives
+        # the same 8-hex-char ID width as the old truncated md5
+        device_id = hashlib.blake2s(id_seed.encode(), digest_size=4).hexdigest()
         
         # Check if we've seen a similar device before (within close frequency/power range)
-        similar_device = None
-        for known_id, known_device in self.known_devices.items():
-            if abs(known_device['frequency'] - center_freq) < 50000 and \
-               abs(known_device['power'] - avg_power) < 5:
-                similar_device = known_device
-                device_id = known_id  # Use the existing ID for consistency
-                break
+        known_id = self._find_similar_device(center_freq, avg_power)
+        if known_id is not None:
+            device_id = known_id  # Use the existing ID for consistency
         
         # Improved device type detection
         # Analyze signal characteristics to determine if it's a phone or network equipment
@@ -242,12 +458,18 @@ class CellularDetector:
             # For network equipment, use a format based on MCC-MNC codes
             # US carriers typically use 310-XXX format
             mcc = "310"  # US Mobile Country Code
-            mnc = str(random.randint(1, 999)).zfill(3)  # Random Mobile Network Code
-            
+            # Seed a local Generator from the device_id so the same piece of
+            # equipment keeps the same network ID across sightings, and draw
+            # the MNC plus serial digits in one vectorized call
+            eq_seed = int.from_bytes(
+                hashlib.blake2b(device_id.encode(), digest_size=8).digest(), 'big')
+            eq_rng = np.random.default_rng(eq_seed)
+            mnc = str(int(eq_rng.integers(1, 1000))).zfill(3)  # Mobile Network Code
+
             # Create a network equipment ID format
             # Format: MCC+MNC+Equipment Type Code+Serial
             equipment_type_code = "01" if "Base" in network_equipment_type else "02"
-            serial = ''.join([str(random.randint(0, 9)) for _ in range(7)])
+            serial = _digits(eq_rng, 7)
             network_id = f"{mcc}{mnc}{equipment_type_code}{serial}"
             
             # Ensure it's exactly 15 digits for consistency with IMEI format
@@ -259,21 +481,23 @@ class CellularDetector:
             simulated_id = network_id
             
             # Set manufacturer based on MNC
-            if mnc in ["020", "070", "090"]:
-                manufacturer = "AT&T"
-            elif mnc in ["004", "010", "012"]:
-                manufacturer = "Verizon"
-            elif mnc in ["260", "240", "250"]:
-                manufacturer = "T-Mobile"
-            elif mnc in ["120", "490", "890"]:
-                manufacturer = "Sprint"
-            else:
-                manufacturer = "Network Operator"
+            manufacturer = _MNC_TO_CARRIER.get(mnc, 'Network Operator')
                 
             # Use network equipment type as subtype
             device_subtype = network_equipment_type
                 
         else:
+            # Classify subtype/manufacturer first (single table lookup keyed
+            # on tech and band instead of the old nested if/elif ladder) so
+            # IMEI generation below sees the resolved manufacturer
+            device_subtype = _SUBTYPE_BY_TECH.get(tech_type, 'Cell Phone')
+            entry = _MFG_TABLE.get((tech_type, band))
+            if entry is None:
+                manufacturer = _MFG_DEFAULT.get(tech_type, 'Unknown')
+            else:
+                low_mfg, high_mfg, papr_split = entry
+                manufacturer = high_mfg if papr > papr_split else low_mfg
+
             # For phones, use standard IMEI generation
             try:
                 simulated_id = self.generate_imei(manufacturer, tech_type, device_id)
@@ -281,47 +505,6 @@ class CellularDetector:
                 print(f"Error in IMEI generation process: {e}")
                 # Ultimate fallback with hardcoded valid IMEI
                 simulated_id = "352999000000000"
-            
-            # Determine device subtypes for cell phones based on technology and characteristics
-            # Replace generic 'GSM'/'LTE' with more specific cell phone types
-            device_subtype = 'Cell Phone'  # Default
-            
-            # Refine device subtype and manufacturer based on technology and frequency
-            if tech_type == 'LTE':
-                device_subtype = 'LTE Phone'
-                # Determine likely manufacturer based on device characteristics
-                if band in [1, 3, 7, 8]:  # International bands
-                    if papr > 8.0:  # Higher PAPR often seen in certain manufacturers
-                        manufacturer = 'Samsung'
-                    else:
-                        manufacturer = 'Apple'
-                elif band in [12, 13, 17]:  # US coverage bands
-                    if papr > 8.5:
-                        manufacturer = 'Google'
-                    else:
-                        manufacturer = 'Apple'
-                elif band in [5, 2, 4]:  # Common US bands
-                    manufacturer = 'Samsung'
-            elif tech_type == 'UMTS':
-                device_subtype = 'UMTS Phone'
-                if band == 1:
-                    manufacturer = 'Nokia'
-                elif band == 2:
-                    manufacturer = 'Motorola'
-                elif band == 4:
-                    manufacturer = 'LG'
-                elif band == 5:
-                    manufacturer = 'Sony'
-                else:
-                    manufacturer = 'Unknown'
-            else:  # GSM
-                device_subtype = 'GSM Phone'
-                if band == 1900:
-                    manufacturer = 'Motorola'
-                elif band == 850:
-                    manufacturer = 'LG'
-                else:
-                    manufacturer = 'Nokia'
         
         # Get the current timestamp
         timestamp = datetime.now().isoformat()
@@ -336,21 +519,28 @@ class CellularDetector:
                 'band': band,
                 'tech': tech_type,  # Keep original technology information
                 'link_type': link_type,
-                'confidence': detection_confidence,
-                'frequency': center_freq,
-                'frequency_mhz': center_freq / 1e6,
-                'power': avg_power,
-                'papr': papr,
-                'burst_count': burst_count,
+                'confidence': float(detection_confidence),
+                # Store plain Python numbers so serialization never has to
+                # special-case NumPy scalar types
+                'frequency': float(center_freq),
+                'frequency_mhz': float(center_freq) / 1e6,
+                'power': float(avg_power),
+                'papr': float(papr),
+                'burst_count': int(burst_count),
                 'imei': simulated_id,  # Standards-compliant IMEI
                 'first_seen': timestamp,
                 'last_seen': timestamp,
                 'location': None  # Will be updated when location data is available
             }
             
+            if device_id not in self.known_devices:
+                self._index_add(device_id, float(center_freq), float(avg_power))
+            else:
+                self._index_update(device_id, float(center_freq), float(avg_power))
             self.known_devices[device_id] = device
-            self.save_cached_data()
-            
+            self._dirty = True
+            self._flush_if_due()
+
             return device
         except Exception as e:
             print(f"Error creating device data structure: {e}")
@@ -369,6 +559,10 @@ class CellularDetector:
 
     def analyze_cellular_signal(self, samples, center_freq, sample_rate):
         """Main method to analyze signal for cellular characteristics"""
+        # 32-bit precision is plenty for RF power estimates; casting once at
+        # the boundary halves the memory bandwidth of every pass downstream
+        # (no copy if the capture path already delivered complex64)
+        samples = np.ascontiguousarray(samples, dtype=np.complex64)
         return self.analyze_signal_characteristics(samples, center_freq, sample_rate)
 
     def generate_imei(self, manufacturer, tech_type, device_id=None):
@@ -377,32 +571,23 @@ class CellularDetector:
             if manufacturer is None:
                 manufacturer = 'Unknown'
                 
-            # TAC prefixes by manufacturer (first 6 digits)
-            # These are approximations based on common TAC ranges
-            tac_prefixes = {
-                'Apple': ['35325', '35391', '35407', '35501', '35502', '35503'],
-                'Samsung': ['35273', '35290', '35332', '35254', '35255', '35256'],
-                'Google': ['35851', '35852', '35853', '35854', '35855', '35856'],
-                'Motorola': ['35089', '35138', '35156', '35157', '35158', '35159'],
-                'LG': ['35201', '35202', '35203', '35204', '35205', '35206'],
-                'Nokia': ['35401', '35402', '35403', '35404', '35405', '35406'],
-                'Unknown': ['35999']
-            }
-            
+            # Draw every random digit from a local Generator seeded from the
+            # device_id, so the same device always yields the same IMEI and
+            # the process-global random state is never touched
+            rng_seed = str(device_id) if device_id else str(time.time())
+            seed_int = int.from_bytes(
+                hashlib.blake2b(rng_seed.encode(), digest_size=8).digest(), 'big')
+            rng = np.random.default_rng(seed_int)
+
             # Get a prefix based on manufacturer
-            prefix = random.choice(tac_prefixes.get(manufacturer, tac_prefixes['Unknown']))
-            
-            # Add 2 more digits to complete the 8-digit TAC
-            tac = prefix + ''.join([str(random.randint(0, 9)) for _ in range(2)])
-            
-            # Generate 6-digit serial number
-            # Use device_id as seed to ensure consistent generation for the same device
-            # If device_id is not provided, use a random seed
-            if device_id:
-                random.seed(str(device_id))
-            else:
-                random.seed(str(time.time()))
-            serial = ''.join([str(random.randint(0, 9)) for _ in range(6)])
+            prefixes = _TAC_PREFIXES.get(manufacturer, _TAC_PREFIXES['Unknown'])
+            prefix = prefixes[int(rng.integers(len(prefixes)))]
+
+            # One vectorized draw covers the 3 digits completing the 8-digit
+            # TAC (the prefixes are 5 digits) plus the 6-digit serial
+            digits = _digits(rng, 9)
+            tac = prefix + digits[:3]
+            serial = digits[3:]
             
             # Combine TAC and Serial
             imei_without_check = tac + serial
@@ -411,20 +596,12 @@ class CellularDetector:
             # The Luhn algorithm is used for the check digit in IMEI
             def calculate_luhn_check_digit(digits):
                 try:
-                    # Double every other digit
-                    doubled = []
-                    for i, digit in enumerate(digits):
-                        if i % 2 == 0:  # Even position (0-indexed)
-                            doubled.append(int(digit))
-                        else:  # Odd position
-                            doubled_digit = int(digit) * 2
-                            if doubled_digit > 9:
-                                doubled_digit = doubled_digit - 9
-                            doubled.append(doubled_digit)
-                    
-                    # Sum all digits
-                    total = sum(doubled)
-                    
+                    # Even positions (0-indexed) pass through; odd positions go
+                    # through the branchless doubled-digit table - all 14
+                    # digits in two strided sums over the raw ASCII bytes
+                    d = np.frombuffer(digits.encode(), dtype=np.uint8) - ord('0')
+                    total = int(d[0::2].sum()) + int(_LUHN_DOUBLE[d[1::2]].sum())
+
                     # The check digit is what needs to be added to make the total divisible by 10
                     check_digit = (10 - (total % 10)) % 10
                     return str(check_digit)
@@ -450,3 +627,42 @@ class CellularDetector:
             print(f"Error generating IMEI: {e}")
             # Fallback to a generic but valid IMEI format if generation fails
             return "352999000000000"
+
+
+def _build_band_table():
+    """Flatten the class band dicts into parallel interval arrays.
+
+    Rows keep the same priority order the original dict scans used
+    (GSM, then UMTS, then LTE; downlink before uplink within each band),
+    so taking the first interval hit reproduces the old lookup exactly.
+    """
+    lows, highs, meta = [], [], []
+    for tech, bands in (('GSM', CellularDetector.GSM_FREQUENCIES),
+                        ('UMTS', CellularDetector.UMTS_FREQUENCIES),
+                        ('LTE', CellularDetector.LTE_BANDS)):
+        for band, ranges in bands.items():
+            for link in ('downlink', 'uplink'):
+                low, high = ranges[link]
+                lows.append(low)
+                highs.append(high)
+                meta.append((tech, band, link))
+    return np.array(lows), np.array(highs), meta
+
+
+_BAND_LO, _BAND_HI, _BAND_META = _build_band_table()
+
+
+@lru_cache(maxsize=4096)
+def _cellular_lookup(freq_khz):
+    """Cached band lookup for a frequency quantized to whole kHz.
+
+    One vectorized interval test over the flattened band table; taking
+    the first hit preserves the original scan priority (GSM before UMTS
+    before LTE, downlink before uplink within each band).
+    """
+    freq_hz = freq_khz * 1000.0
+    hits = np.flatnonzero((_BAND_LO <= freq_hz) & (freq_hz <= _BAND_HI))
+    if hits.size:
+        tech, band, link = _BAND_META[int(hits[0])]
+        return True, tech, band, link
+    return False, None, None, None
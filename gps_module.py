@@ -1,12 +1,63 @@
 import serial.tools.list_ports
 from serial import Serial, SerialException
-import pynmea2
+import re
 import threading
 import time
 import logging
 import os
 import random
 
+
+# Default logging setup happens once at import, not per constructed module
+logging.basicConfig(level=logging.INFO)
+
+# Any complete NMEA sentence with a checksum, used to validate a baudrate
+_NMEA_PROBE_RE = re.compile(rb'\$G[A-Z][A-Z]{3},[^\r\n]*\*[0-9A-Fa-f]{2}')
+
+# Common GPS baudrates, tried in order after the configured one
+_COMMON_BAUDRATES = (4800, 9600, 38400, 115200)
+
+# USB vendor/product ids of common GPS receiver chips and the baudrate
+# they ship at. A recognized device connects straight at its factory
+# rate instead of walking the whole probe list
+_KNOWN_GPS_CHIPS = {
+    (0x1546, 0x01a6): 9600,   # u-blox ANTARIS
+    (0x1546, 0x01a7): 9600,   # u-blox 5
+    (0x1546, 0x01a8): 9600,   # u-blox 6
+    (0x1546, 0x01a9): 9600,   # u-blox 7/8
+    (0x067b, 0x2303): 4800,   # Prolific PL2303 (SiRF-based GPS mice)
+    (0x10c4, 0xea60): 9600,   # Silicon Labs CP210x bridges
+}
+
+
+def _nmea_checksum_ok(line):
+    """Validate the XOR checksum of a raw NMEA sentence (bytes)."""
+    star = line.rfind(b'*')
+    if star == -1 or star + 3 > len(line):
+        return False
+    checksum = 0
+    for b in line[1:star]:
+        checksum ^= b
+    try:
+        return checksum == int(line[star + 1:star + 3], 16)
+    except ValueError:
+        return False
+
+
+def _nmea_to_deg(value, hemi):
+    """Convert an NMEA ddmm.mmmm/dddmm.mmmm field to signed degrees.
+
+    Returns None for empty fields (no fix).
+    """
+    if not value:
+        return None
+    v = float(value)
+    deg = int(v / 100)
+    result = deg + (v - deg * 100) / 60.0
+    if hemi in (b'S', b'W'):
+        result = -result
+    return result
+
 class GPSModule:
     def __init__(self, port=None, baudrate=4800, simulation_mode=False, force_real=False):
         """
@@ -23,15 +74,25 @@ class GPSModule:
         self.serial_conn = None
         self.running = False
         self.thread = None
-        self.current_location = None
+        # Location snapshot: an immutable tuple of
+        # (lat, lon, alt, num_satellites, hdop, timestamp, simulated)
+        # assigned in a single attribute write. Readers on other threads
+        # always see a complete, consistent fix without any locking
+        self._loc = None
         self.last_update = None
         self.logger = logging.getLogger("gps_module")
         self.simulation_mode = simulation_mode
         self.force_real = force_real
         self.using_real_gps = False
-        
-        # Set up logging
-        logging.basicConfig(level=logging.INFO)
+
+        # Dispatch NMEA sentences on their talker+type prefix; only GGA and
+        # RMC carry the position data this module consumes, and the
+        # specialized byte-level handlers skip generic pynmea2 parsing of
+        # every other sentence on the serial thread
+        self._nmea_handlers = {
+            b'$GPGGA': self._handle_gga, b'$GNGGA': self._handle_gga,
+            b'$GPRMC': self._handle_rmc, b'$GNRMC': self._handle_rmc,
+        }
     
     def start(self):
         """Start reading GPS data in a separate thread"""
@@ -68,115 +129,160 @@ class GPSModule:
             self.logger.info("Falling back to GPS simulation mode")
             self._run_simulation()
     
+    def _set_low_latency(self):
+        """Ask the USB-serial driver to deliver bytes immediately (Linux).
+
+        FTDI adapters otherwise coalesce received bytes into 16 ms USB
+        frames, adding latency to every NMEA sentence. Best-effort: silently
+        skipped on platforms or drivers without TIOCGSERIAL support.
+        """
+        try:
+            import fcntl
+            import struct
+            import termios
+            ASYNC_LOW_LATENCY = 0x2000
+            fd = self.serial_conn.fileno()
+            buf = bytearray(fcntl.ioctl(fd, termios.TIOCGSERIAL, bytes(72)))
+            # flags is the fifth int field of struct serial_struct
+            flags = struct.unpack_from('i', buf, 16)[0]
+            struct.pack_into('i', buf, 16, flags | ASYNC_LOW_LATENCY)
+            fcntl.ioctl(fd, termios.TIOCSSERIAL, buf)
+        except Exception as e:
+            self.logger.debug("Could not enable low-latency serial mode: %s", e)
+
     def _try_connect_real_gps(self):
         """Try to connect to a real GPS device"""
-        # Common baudrates for GPS devices
-        baudrates_to_try = [self.baudrate]  # Start with the specified baudrate
-        
-        # If the specified baudrate is not one of these common ones, add them to the list
-        common_baudrates = [4800, 9600, 38400, 115200]
-        for baudrate in common_baudrates:
+        # A recognized USB GPS chip skips the multi-baudrate probe: open
+        # it directly at the factory baudrate its chipset ships with
+        try:
+            for p in serial.tools.list_ports.comports():
+                known_baud = _KNOWN_GPS_CHIPS.get((p.vid, p.pid))
+                if known_baud is None:
+                    continue
+                if self.port is not None and p.device != self.port:
+                    continue
+                self.logger.info(f"Recognized GPS chip on {p.device} "
+                                 f"(vid={p.vid:04x} pid={p.pid:04x}), "
+                                 f"using baudrate {known_baud}")
+                if self._probe_baudrate(p.device, known_baud):
+                    return True
+        except Exception as e:
+            self.logger.debug("Port enumeration failed: %s", e)
+
+        # Fall back to probing: configured baudrate first, then the
+        # remaining common GPS rates
+        baudrates_to_try = [self.baudrate]
+        for baudrate in _COMMON_BAUDRATES:
             if baudrate != self.baudrate:
                 baudrates_to_try.append(baudrate)
-        
-        # Try each baudrate
+
         for baudrate in baudrates_to_try:
-            try:
-                self.logger.info(f"Trying to connect to GPS device on {self.port} with baudrate {baudrate}")
-                self.serial_conn = Serial(port=self.port, baudrate=baudrate, timeout=1)
-                self.logger.info(f"Connected to GPS device on {self.port} with baudrate {baudrate}")
-                
-                # Try to read data for a few seconds to see if we get valid NMEA sentences
-                start_time = time.time()
-                valid_data_found = False
-                
-                while self.running and (time.time() - start_time) < 10:  # Try for 10 seconds
-                    try:
-                        line = self.serial_conn.readline().decode('ascii', errors='replace').strip()
-                        if line:
-                            self.logger.debug(f"Raw GPS data: {line}")
-                            
-                        if line.startswith('$'):
-                            try:
-                                msg = pynmea2.parse(line)
-                                self.logger.debug(f"Parsed NMEA message: {msg}")
-                                valid_data_found = True
-                                
-                                # If we found a valid message, start processing GPS data
-                                self.using_real_gps = True
-                                self._process_gps_data()
-                                return True
-                            except pynmea2.ParseError as pe:
-                                self.logger.debug(f"NMEA parse error: {pe} for line: {line}")
-                    except UnicodeDecodeError as ude:
-                        self.logger.debug(f"Unicode decode error: {ude}")
-                    except Exception as e:
-                        self.logger.error(f"Error reading GPS data: {e}")
-                        time.sleep(0.1)
-                
-                if not valid_data_found:
-                    self.logger.info(f"No valid NMEA data found with baudrate {baudrate}")
-                    self.serial_conn.close()
-            except SerialException as e:
-                self.logger.error(f"Error connecting to GPS device with baudrate {baudrate}: {e}")
-                continue
-        
+            if self._probe_baudrate(self.port, baudrate):
+                return True
+
         self.logger.error("Could not connect to a real GPS device")
         return False
+
+    def _probe_baudrate(self, port, baudrate):
+        """Open a port at one baudrate and start reading if NMEA appears.
+
+        Grabs one burst of bytes and scans for a complete checksummed
+        sentence. The timeout covers a full reporting interval of a 1 Hz
+        receiver, so a wrong baudrate is rejected after one read instead
+        of a multi-second readline poll loop.
+        """
+        try:
+            self.logger.info(f"Trying to connect to GPS device on {port} with baudrate {baudrate}")
+            self.serial_conn = Serial(port=port, baudrate=baudrate, timeout=1.2)
+            self._set_low_latency()
+
+            data = self.serial_conn.read(4096)
+            self.logger.debug("Baudrate probe read %d bytes", len(data))
+            if _NMEA_PROBE_RE.search(data):
+                self.logger.info(f"Connected to GPS device on {port} with baudrate {baudrate}")
+                self.using_real_gps = True
+                self._process_gps_data()
+                return True
+
+            self.logger.info(f"No valid NMEA data found with baudrate {baudrate}")
+            self.serial_conn.close()
+        except SerialException as e:
+            self.logger.error(f"Error connecting to GPS device with baudrate {baudrate}: {e}")
+        return False
     
+    def _handle_gga(self, line):
+        """Parse a GGA sentence (fix, position, altitude) from raw bytes"""
+        try:
+            fields = line.split(b',')
+            latitude = _nmea_to_deg(fields[2], fields[3])
+            longitude = _nmea_to_deg(fields[4], fields[5])
+            if latitude is None or longitude is None:
+                return
+            # One atomic attribute write publishes the whole fix
+            self._loc = (
+                latitude,
+                longitude,
+                float(fields[9]) if fields[9] else 0.0,
+                int(fields[7]) if fields[7] else 0,
+                float(fields[8]) if fields[8] else 0.0,
+                fields[1].decode(),
+                False,
+            )
+            self.last_update = time.time()
+            self.logger.debug("GPS location updated: %s", self._loc)
+        except (ValueError, IndexError, UnicodeDecodeError) as e:
+            self.logger.error(f"Error converting GGA data: {e}, raw data: {line}")
+
+    def _handle_rmc(self, line):
+        """Parse an RMC sentence; fallback when no GGA fix is held yet"""
+        if self._loc:
+            return
+        try:
+            fields = line.split(b',')
+            if fields[2] != b'A':  # V marks a void fix
+                return
+            latitude = _nmea_to_deg(fields[3], fields[4])
+            longitude = _nmea_to_deg(fields[5], fields[6])
+            if latitude is None or longitude is None:
+                return
+            # RMC carries no altitude, satellite count or HDOP
+            self._loc = (latitude, longitude, 0.0, 0, 0.0,
+                         fields[1].decode(), False)
+            self.last_update = time.time()
+            self.logger.debug("GPS location updated from RMC: %s", self._loc)
+        except (ValueError, IndexError, UnicodeDecodeError) as e:
+            self.logger.error(f"Error converting RMC data: {e}, raw data: {line}")
+
     def _process_gps_data(self):
         """Process GPS data from the connected device"""
         try:
+            pending = bytearray()
             while self.running:
                 try:
-                    line = self.serial_conn.readline().decode('ascii', errors='replace').strip()
-                    if line:
-                        self.logger.debug(f"Raw GPS data: {line}")
-                        
-                    if line.startswith('$'):
-                        try:
-                            msg = pynmea2.parse(line)
-                            
-                            # Process different NMEA message types
-                            if isinstance(msg, pynmea2.GGA):
-                                self.logger.info(f"GGA message received: lat={msg.latitude}, lon={msg.longitude}")
-                                if msg.latitude and msg.longitude:
-                                    try:
-                                        self.current_location = {
-                                            'latitude': float(msg.latitude),
-                                            'longitude': float(msg.longitude),
-                                            'altitude': float(msg.altitude) if msg.altitude else 0.0,
-                                            'num_satellites': str(msg.num_sats) if msg.num_sats else '0',
-                                            'hdop': float(msg.horizontal_dil) if msg.horizontal_dil else 0.0,
-                                            'timestamp': msg.timestamp,
-                                            'simulated': False
-                                        }
-                                        self.last_update = time.time()
-                                        self.logger.info(f"GPS location updated: {self.current_location}")
-                                    except (ValueError, TypeError) as e:
-                                        self.logger.error(f"Error converting GGA data: {e}, raw data: {msg}")
-                            elif isinstance(msg, pynmea2.RMC) and not self.current_location:
-                                # Use RMC as a fallback if we don't have GGA data
-                                self.logger.info(f"RMC message received: lat={msg.latitude}, lon={msg.longitude}")
-                                if msg.latitude and msg.longitude:
-                                    try:
-                                        self.current_location = {
-                                            'latitude': float(msg.latitude),
-                                            'longitude': float(msg.longitude),
-                                            'altitude': 0.0,  # RMC doesn't have altitude
-                                            'num_satellites': '0',  # RMC doesn't have satellite count
-                                            'hdop': 0.0,  # RMC doesn't have HDOP
-                                            'timestamp': msg.timestamp,
-                                            'simulated': False
-                                        }
-                                        self.last_update = time.time()
-                                        self.logger.info(f"GPS location updated from RMC: {self.current_location}")
-                                    except (ValueError, TypeError) as e:
-                                        self.logger.error(f"Error converting RMC data: {e}, raw data: {msg}")
-                        except pynmea2.ParseError as pe:
-                            self.logger.error(f"NMEA parse error: {pe} for line: {line}")
-                except UnicodeDecodeError as ude:
-                    self.logger.error(f"Unicode decode error: {ude}")
+                    # Drain everything the driver has buffered in one read
+                    # syscall per wake-up instead of one readline per sentence
+                    chunk = self.serial_conn.read(self.serial_conn.in_waiting or 1)
+                    if not chunk:
+                        continue
+                    pending += chunk
+                    if b'\n' not in chunk:
+                        continue
+                    *lines, rest = pending.split(b'\n')
+                    pending = bytearray(rest)
+                    for line in lines:
+                        # bytes, not bytearray, so the prefix can key the dict
+                        line = bytes(line.strip())
+                        if not line:
+                            continue
+                        self.logger.debug("Raw GPS data: %s", line)
+
+                        # Dispatch on the 6-byte talker+type prefix; sentences
+                        # other than GGA/RMC are skipped without parsing, and
+                        # handled ones are checksum-verified first (pynmea2
+                        # used to do this before the byte-level handlers)
+                        handler = self._nmea_handlers.get(line[:6])
+                        if handler and _nmea_checksum_ok(line):
+                            handler(line)
                 except Exception as e:
                     self.logger.error(f"Error reading GPS data: {e}")
                     time.sleep(1)
@@ -191,47 +297,63 @@ class GPSModule:
     
     def _run_simulation(self):
         """Run GPS simulation"""
-        # Simulate GPS data - using a more realistic starting location
-        self.current_location = {
-            'latitude': 39.8283,  # Approximate center of US
-            'longitude': -98.5795,  # Approximate center of US
-            'altitude': 10.0,
-            'num_satellites': '8',
-            'hdop': 1.2,
-            'timestamp': time.time(),
-            'simulated': True
-        }
+        # Simulate GPS data - using a more realistic starting location.
+        # State lives in plain local variables (satellite count stays an
+        # int); each tick publishes a fresh immutable snapshot tuple
+        latitude = 39.8283  # Approximate center of US
+        longitude = -98.5795  # Approximate center of US
+        altitude = 10.0
+        num_satellites = 8
+        hdop = 1.2
+        self._loc = (latitude, longitude, altitude, num_satellites, hdop,
+                     time.time(), True)
         self.last_update = time.time()
-        self.logger.info(f"Simulated GPS location initialized: {self.current_location}")
-        
+        self.logger.info(f"Simulated GPS location initialized: {self._loc}")
+
         # Simulate small movements over time
         while self.running:
             time.sleep(1)
             # Add some random movement to make it more realistic
-            self.current_location['latitude'] += random.uniform(-0.0001, 0.0001)
-            self.current_location['longitude'] += random.uniform(-0.0001, 0.0001)
-            self.current_location['num_satellites'] = str(max(4, min(12, int(self.current_location['num_satellites']) + random.randint(-1, 1))))
-            self.current_location['hdop'] = max(0.8, min(2.5, self.current_location['hdop'] + random.uniform(-0.1, 0.1)))
+            latitude += random.uniform(-0.0001, 0.0001)
+            longitude += random.uniform(-0.0001, 0.0001)
+            num_satellites = max(4, min(12, num_satellites + random.randint(-1, 1)))
+            hdop = max(0.8, min(2.5, hdop + random.uniform(-0.1, 0.1)))
+            self._loc = (latitude, longitude, altitude, num_satellites, hdop,
+                         time.time(), True)
             self.last_update = time.time()
-            self.logger.debug(f"Simulated GPS location updated: {self.current_location}")
-    
+            self.logger.debug("Simulated GPS location updated: %s", self._loc)
+
     def get_location(self):
         """
         Get the current GPS location.
-        
+
         Returns:
             dict: Dictionary containing latitude, longitude, altitude, etc.
                   or None if no location data is available
         """
-        return self.current_location
-    
+        loc = self._loc
+        if loc is None:
+            return None
+        # Build the dict on read from the immutable snapshot; the
+        # satellite count is stringified only here, at the API boundary
+        latitude, longitude, altitude, num_satellites, hdop, timestamp, simulated = loc
+        return {
+            'latitude': latitude,
+            'longitude': longitude,
+            'altitude': altitude,
+            'num_satellites': str(num_satellites),
+            'hdop': hdop,
+            'timestamp': timestamp,
+            'simulated': simulated
+        }
+
     def is_connected(self):
         """Check if the GPS device is connected and providing data"""
         # If in simulation mode, always return True
         if self.simulation_mode and not self.using_real_gps:
             return True
-            
-        if not self.current_location:
+
+        if not self._loc:
             return False
         
         # Consider the connection active if we've received data in the last 5 seconds
@@ -1,19 +1,51 @@
 #!/usr/bin/env python3
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy import signal
+from scipy import fft as sp_fft
+from scipy import signal as sp_signal
 import time
 import json
-from json_utils import CustomJSONEncoder
+import orjson
 from datetime import datetime
 import subprocess
 import struct
 import os
+import queue
 import random
-import uuid
+import threading
 from cellular_detector import CellularDetector
 from cellular_decoder import CellularDecoder
 
+# Frequency ranges (MHz, inclusive) mapped to a technology for classifying
+# simulated peaks, listed in the priority order of the old if/elif ladder:
+# where bands overlap (e.g. UMTS Band 8 inside GSM 900), the earlier entry
+# wins. Flattened below into a 1 MHz-granularity lookup array
+_PEAK_TECH_RANGES = [
+    (1920, 1980, 'UMTS'), (2110, 2170, 'UMTS'),  # UMTS Band 1
+    (1850, 1910, 'UMTS'), (1930, 1990, 'UMTS'),  # UMTS Band 2
+    (1710, 1755, 'UMTS'), (2110, 2155, 'UMTS'),  # UMTS Band 4
+    (824, 849, 'UMTS'), (869, 894, 'UMTS'),      # UMTS Band 5
+    (880, 915, 'UMTS'), (925, 960, 'UMTS'),      # UMTS Band 8
+    (699, 746, 'LTE'),                           # LTE Band 12, 13, 17
+    (2500, 2690, 'LTE'),                         # LTE Band 7
+    (2305, 2360, 'LTE'),                         # LTE Band 30
+    (890, 960, 'GSM'),                           # GSM 900
+    (1710, 1880, 'GSM'),                         # GSM 1800
+]
+
+
+def _build_peak_tech_table():
+    """Flatten the priority-ordered ranges into an array indexed by MHz."""
+    table = np.full(3001, '', dtype='U4')
+    # Reverse order so higher-priority (earlier) entries overwrite
+    for low, high, tech in reversed(_PEAK_TECH_RANGES):
+        table[low:high + 1] = tech
+    return table
+
+
+_PEAK_TECH_TABLE = _build_peak_tech_table()
+
+
 class RFMonitor:
     # Common cellular frequency bands to scan (in MHz) - prioritized for cell phones
     CELLULAR_BANDS = [
@@ -36,8 +68,33 @@ class RFMonitor:
         self.cellular_decoder = CellularDecoder(sample_rate=20e6, gain=40)
         self.current_band_index = 0
         self.scan_results = {}
-        self.device_ids = set()
+        # Monotonic counter for simulated-device ids; uniqueness by
+        # construction, no registry of every id ever handed out
+        self._next_id = 0
         self.verify_hackrf()
+        # Background capture: one continuously running hackrf_transfer
+        # stream feeds a small ring of preallocated raw-I/Q buffers, so
+        # capture and analysis overlap instead of paying a process spawn
+        # plus a blocking read on every call. The free/filled queue pair
+        # is the classic empty/full ring-buffer handshake
+        self._num_samples = 524288
+        self._free_slots = queue.Queue()
+        self._filled_slots = queue.Queue(maxsize=4)
+        for _ in range(4):
+            self._free_slots.put(bytearray(self._num_samples * 2))
+        self._capture_thread = threading.Thread(target=self._capture_loop,
+                                                daemon=True)
+        self._capture_thread.start()
+        # Disk writes happen on a dedicated writer thread so the
+        # capture/analyze loop never blocks on serialization or I/O
+        self._write_q = queue.Queue(maxsize=4)
+        self._writer_thread = threading.Thread(target=self._writer_loop,
+                                               daemon=True)
+        self._writer_thread.start()
+        # Persistent spectrum figure, created lazily on the first plot
+        self._fig = None
+        self._ax = None
+        self._line = None
         
     def verify_hackrf(self):
         """Verify HackRF One is connected and working"""
@@ -52,163 +109,155 @@ class RFMonitor:
             print(f"Error verifying HackRF: {str(e)}")
             raise
     
-    def next_frequency_band(self):
+    def _next_band_index(self, band_index):
         """Rotate through cellular frequency bands with emphasis on common cell phone frequencies"""
         # More sophisticated rotation that spends more time on high-value bands
         # The first 4 bands in our list are the most common for cell phones
         # This gives higher priority to the first 4 bands (70% chance)
-        if random.random() < 0.7 and self.current_band_index >= 4:
+        if random.random() < 0.7 and band_index >= 4:
             # Go back to one of the high-priority bands
-            self.current_band_index = random.randint(0, 3)
-        else:
-            # Normal rotation
-            self.current_band_index = (self.current_band_index + 1) % len(self.CELLULAR_BANDS)
-        
-        self.center_freq = self.CELLULAR_BANDS[self.current_band_index] * 1e6
-        return self.center_freq
-    
-    # Cache to store recent samples by frequency
-    _sample_cache = {}
-    _cache_timestamp = {}
-    _cache_max_age = 2.0  # Maximum age in seconds
-    _sample_count = 0
-    
-    def capture_samples(self, num_samples=524288):  # Reduced sample size by half
-        """Capture RF samples focusing on cell phone frequencies with caching"""
-        try:
-            current_time = time.time()
-            
-            # Check if we should change frequency
-            # Only change frequency every few captures to improve performance
-            if self._sample_count % 3 == 0:  # Less frequent band rotation
-                self.next_frequency_band()
-            self._sample_count += 1
-            
-            # Check if we have recent cached samples for this frequency
-            freq_key = str(int(self.center_freq))
-            if (freq_key in self._sample_cache and 
-                freq_key in self._cache_timestamp and
-                current_time - self._cache_timestamp[freq_key] < self._cache_max_age):
-                # Use cached samples
-                print(f"Using cached samples for {self.center_freq/1e6:.2f} MHz")
-                return self._sample_cache[freq_key]
-            
-            # Create temporary files with unique names to avoid conflicts
-            temp_id = str(int(time.time() * 1000))[-6:]
-            samples_file = f'samples_{temp_id}.bin'
-            
-            # Construct hackrf_transfer command with reduced sample size
-            cmd = [
-                'hackrf_transfer',
-                '-r', samples_file,
-                '-f', str(int(self.center_freq)),
-                '-s', str(int(self.sample_rate)),
-                '-n', str(num_samples),  # Reduced from 1048576
-                '-l', '40',  # LNA gain
-                '-g', '40',  # VGA gain
-                '-a', '1'    # Amp enable
-            ]
-            
-            # Run the command
-            print(f"Capturing samples at {self.center_freq/1e6:.2f} MHz...")
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode != 0:
-                raise Exception(f"hackrf_transfer failed: {result.stderr}")
-            
-            # No sleep - we'll check for the file directly
-            # Give the file system a moment to register the file, much shorter than 1s
-            max_retries = 10
-            retry_delay = 0.1
-            for _ in range(max_retries):
-                if os.path.exists(samples_file) and os.path.getsize(samples_file) > 0:
-                    break
-                time.sleep(retry_delay)
-            
-            # Check if file exists and has content
-            if not os.path.exists(samples_file):
-                raise Exception("Samples file was not created")
-            
-            if os.path.getsize(samples_file) == 0:
-                raise Exception("Samples file is empty")
-            
-            # Read the binary data
-            with open(samples_file, 'rb') as f:
-                data = f.read()
-            
-            # Clean up
+            return random.randint(0, 3)
+        # Normal rotation
+        return (band_index + 1) % len(self.CELLULAR_BANDS)
+
+    def _capture_loop(self):
+        """Producer thread: keep one hackrf_transfer stream ('-r -')
+        open per band and fill free ring slots with raw interleaved int8
+        I/Q as it arrives. Band rotation happens here, restarting the
+        stream only when the frequency actually changes. Rotation state
+        stays local to this thread: the consumer learns each capture's
+        frequency from the queued (freq, slot) pair, never from a shared
+        attribute that could rotate mid-analysis."""
+        proc = None
+        proc_freq = None
+        band_index = self.current_band_index
+        captures = 0
+        while True:
             try:
-                os.remove(samples_file)
+                # Rotate bands every few captures, same cadence as before
+                if captures % 3 == 0:
+                    band_index = self._next_band_index(band_index)
+                captures += 1
+                freq = self.CELLULAR_BANDS[band_index] * 1e6
+
+                if proc is None or proc_freq != freq:
+                    if proc is not None:
+                        proc.kill()
+                        proc.wait()
+                    # No '-n': hackrf_transfer streams indefinitely by
+                    # default, and '-n 0' would set a zero-byte budget
+                    # that makes the first RX callback exit immediately
+                    cmd = [
+                        'hackrf_transfer',
+                        '-r', '-',
+                        '-f', str(int(freq)),
+                        '-s', str(int(self.sample_rate)),
+                        '-l', '40',  # LNA gain
+                        '-g', '40',  # VGA gain
+                        '-a', '1'    # Amp enable
+                    ]
+                    print(f"Streaming samples at {freq/1e6:.2f} MHz...")
+                    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                                            stderr=subprocess.DEVNULL)
+                    proc_freq = freq
+
+                slot = self._free_slots.get()
+                view = memoryview(slot)
+                filled = 0
+                while filled < len(slot):
+                    nread = proc.stdout.readinto(view[filled:])
+                    if not nread:
+                        break
+                    filled += nread
+
+                if filled < len(slot):
+                    # Stream died mid-capture; recycle the slot and
+                    # relaunch on the next pass
+                    self._free_slots.put(slot)
+                    proc.kill()
+                    proc.wait()
+                    proc = None
+                    time.sleep(1)
+                    continue
+
+                self._filled_slots.put((freq, slot))
+
             except Exception as e:
-                print(f"Warning: Could not remove temporary file: {e}")
-            
-            # Convert to numpy array
-            samples = np.frombuffer(data, dtype=np.int8)
-            
-            # Convert to complex numbers (I/Q data)
-            samples = samples[::2] + 1j * samples[1::2]
-            samples = samples.astype(np.complex64)
-            
-            # Cache the samples
-            self._sample_cache[freq_key] = samples
-            self._cache_timestamp[freq_key] = current_time
-            
-            # Clean old cache entries
-            for key in list(self._cache_timestamp.keys()):
-                if current_time - self._cache_timestamp[key] > self._cache_max_age:
-                    del self._sample_cache[key]
-                    del self._cache_timestamp[key]
-            
-            return samples
-            
+                print(f"Error in capture thread: {str(e)}")
+                time.sleep(1)
+
+    def capture_samples(self, num_samples=524288):
+        """Pull the next capture from the background ring buffer.
+
+        Returns a (center_freq, samples) pair, or None when no capture
+        is available. The frequency rides alongside the samples so the
+        analysis matches the data even while the producer keeps rotating
+        bands in the background.
+        """
+        try:
+            # Short timeout: callers run on the web server's event loop,
+            # so a producer with no data (missing hardware, stream
+            # restart) must degrade to a quick None like the old
+            # synchronous path did, not stall every endpoint for 30 s
+            freq, slot = self._filled_slots.get(timeout=2)
+
+            # Convert interleaved int8 I/Q to complex64 in one contiguous
+            # pass: (N,2) view, int8->float32 cast, then reinterpret each
+            # (re, im) float pair as a complex64. The cast copies, so the
+            # raw slot can be recycled immediately
+            samples = (np.frombuffer(slot, dtype=np.int8)
+                       .reshape(-1, 2)
+                       .astype(np.float32)
+                       .view(np.complex64)
+                       .reshape(-1))
+            self._free_slots.put(slot)
+
+            return freq, samples
+
+        except queue.Empty:
+            print("Timed out waiting for the capture thread")
+            return None
         except Exception as e:
             print(f"Error capturing samples: {str(e)}")
-            if os.path.exists(samples_file):
-                os.remove(samples_file)
             return None
 
-    def analyze_spectrum(self, samples):
-        """Analyze the spectrum using FFT and detect cellular signals"""
+    def analyze_spectrum(self, samples, center_freq=None):
+        """Analyze the spectrum using FFT and detect cellular signals.
+
+        center_freq is the frequency the samples were captured at, as
+        returned by capture_samples; it defaults to the monitor's tuned
+        frequency for callers with their own samples.
+        """
         if samples is None or len(samples) == 0:
             return None
-            
+
+        if center_freq is None:
+            center_freq = self.center_freq
+
         try:
-            # Helper function to convert NumPy types to native Python types
-            def convert_numpy_types(obj):
-                if isinstance(obj, dict):
-                    return {k: convert_numpy_types(v) for k, v in obj.items()}
-                elif isinstance(obj, list):
-                    return [convert_numpy_types(item) for item in obj]
-                elif isinstance(obj, np.integer):
-                    return int(obj)
-                elif isinstance(obj, np.floating):
-                    return float(obj)
-                elif isinstance(obj, np.ndarray):
-                    return obj.tolist()
-                else:
-                    return obj
-            
-            # Apply window function
-            window = np.hamming(len(samples))
-            samples_windowed = samples * window
-            
-            # Compute FFT
-            fft = np.fft.fft(samples_windowed)
-            fft = np.fft.fftshift(fft)
-            
-            # Calculate frequencies
-            freqs = np.fft.fftshift(np.fft.fftfreq(len(samples), 1/self.sample_rate))
-            
-            # Add center frequency offset
-            freqs = freqs + self.center_freq
-            
-            # Calculate power
-            power_db = 20 * np.log10(np.abs(fft))
-            power_db = power_db - np.max(power_db)  # Normalize
+            # Welch's method: average many overlapping 8K-point FFTs
+            # instead of one full-length transform. Each segment fits in
+            # L2 cache and the averaging slashes the variance of the
+            # estimate, so the spectrum is both faster and less noisy
+            f, pxx = sp_signal.welch(samples, fs=self.sample_rate,
+                                     nperseg=8192, noverlap=4096,
+                                     return_onesided=False, detrend=False,
+                                     scaling='spectrum')
+
+            # Shift to a monotonic axis and add the center frequency offset
+            freqs = sp_fft.fftshift(f) + center_freq
+
+            # Convert to dB in place and normalize; the epsilon guards
+            # log10 against all-zero segments
+            power_db = sp_fft.fftshift(pxx)
+            power_db += 1e-20
+            np.log10(power_db, out=power_db)
+            power_db *= 10
+            power_db -= power_db.max()  # Normalize
             
             # Check for cellular signals
             cellular_data = self.cellular_detector.analyze_cellular_signal(
-                samples, self.center_freq, self.sample_rate
+                samples, center_freq, self.sample_rate
             )
             
             # If cellular signal detected, try to extract actual IMEIs
@@ -220,9 +269,9 @@ class RFMonitor:
                 try:
                     # Only attempt IMEI extraction for strong signals
                     if cellular_data.get('power', -100) > -50:
-                        print(f"Attempting to extract actual IMEIs for {tech_type} signal at {self.center_freq/1e6} MHz")
+                        print(f"Attempting to extract actual IMEIs for {tech_type} signal at {center_freq/1e6} MHz")
                         imeis = self.cellular_decoder.capture_and_decode(
-                            self.center_freq, 
+                            center_freq, 
                             duration=5,  # 5 seconds capture
                             technology=tech_type
                         )
@@ -238,25 +287,29 @@ class RFMonitor:
                 except Exception as e:
                     print(f"Error extracting IMEIs: {e}")
             
-            # Convert to MHz for better readability
+            # Convert to MHz for better readability. Keep both axes as
+            # ndarrays - expanding million-point captures into Python float
+            # lists costs ~50 bytes per element and every later consumer
+            # (peak sampling, serialization) handles arrays directly
             freqs_mhz = freqs / 1e6
-            
+
             result = {
-                'frequencies': freqs_mhz.tolist(),
-                'power_db': power_db.tolist(),
+                'frequencies': freqs_mhz,
+                'power_db': power_db,
                 'timestamp': datetime.now().isoformat(),
-                'center_freq': self.center_freq / 1e6,
+                'center_freq': center_freq / 1e6,
                 'sample_rate': self.sample_rate / 1e6,
                 'bandwidth': self.sample_rate / 1e6
             }
             
-            # Add cellular data if detected
+            # Add cellular data if detected. NumPy types survive as-is:
+            # both serialization paths (orjson with OPT_SERIALIZE_NUMPY
+            # and CustomJSONEncoder) convert them once, at encode time
             if cellular_data:
-                # Make sure all NumPy types are converted to native Python types
-                result['cellular_data'] = convert_numpy_types(cellular_data)
+                result['cellular_data'] = cellular_data
                 
             # Store results in scan_results dictionary
-            band_key = f"{int(self.center_freq/1e6)}"
+            band_key = f"{int(center_freq/1e6)}"
             self.scan_results[band_key] = result
             
             # Combine all scan results for comprehensive view
@@ -280,76 +333,77 @@ class RFMonitor:
             'devices': []
         }
         
+        # Batch-draw every random field for the worst case of 3 peaks per
+        # band in a handful of vectorized calls; the loop below only
+        # consumes the precomputed arrays, so no RNG state is touched
+        # (and no RNG lock taken) inside the per-device hot path
+        bands = list(self.scan_results.items())
+        cap = 3 * len(bands)
+        rng = np.random.default_rng()
+        peak_counts = rng.integers(1, 4, size=len(bands))  # 1-3 peaks per band
+        keep_draws = rng.random(cap)
+        idx_draws = rng.random(cap)  # Scaled per band (lengths differ)
+        fallback_types = rng.choice(['GSM', 'UMTS', 'LTE'], size=cap,
+                                    p=[0.2, 0.3, 0.5])
+        network_codes = rng.integers(10, 100, size=cap)
+        unique_draws = rng.integers(0, 10**10, size=cap)
+        draw = 0
+
+        # Set-keyed dedup: one O(1) membership test per device instead of
+        # rescanning the whole combined list for every candidate
+        seen_ids = set()
+
         # Add simulated devices from all scans
-        for band_key, result in self.scan_results.items():
+        for band_num, (band_key, result) in enumerate(bands):
             # Generate some simulated devices for this band
             if 'cellular_data' in result and result['cellular_data']:
                 device = result['cellular_data']
                 # Add to combined devices list if not already present
-                if not any(d.get('id') == device['id'] for d in combined['devices']):
+                if device['id'] not in seen_ids:
+                    seen_ids.add(device['id'])
                     combined['devices'].append(device)
-            
+
             # Add some random peaks as potential devices
-            num_peaks = random.randint(1, 3)  # 1-3 peaks per band
+            num_peaks = int(peak_counts[band_num])  # 1-3 peaks per band
             for _ in range(num_peaks):
+                slot = draw
+                draw += 1
+
                 # Only add with 50% probability to avoid too many devices
-                if random.random() < 0.5:
+                if keep_draws[slot] < 0.5:
                     continue
-                    
+
                 # Get a random index within the frequency array
-                if not result['frequencies'] or not result['power_db']:
+                if len(result['frequencies']) == 0 or len(result['power_db']) == 0:
                     continue
-                    
-                idx = random.randint(0, len(result['frequencies']) - 1)
-                freq = result['frequencies'][idx]
-                power = result['power_db'][idx]
-                
+
+                idx = int(idx_draws[slot] * len(result['frequencies']))
+                freq = float(result['frequencies'][idx])
+                power = float(result['power_db'][idx])
+
                 # Only add if power is above threshold
                 if power < -40:
                     continue
-                
+
                 # Create a unique device ID
-                device_id = str(uuid.uuid4())
-                while device_id in self.device_ids:
-                    device_id = str(uuid.uuid4())
-                self.device_ids.add(device_id)
-                
+                self._next_id += 1
+                device_id = f"dev-{self._next_id:08x}"
+
                 # Generate a simulated IMSI/IMEI
                 country_code = "310"  # USA
-                network_code = str(random.randint(10, 99))
-                unique_digits = "".join([str(random.randint(0, 9)) for _ in range(10)])
+                network_code = str(network_codes[slot])
+                unique_digits = f"{unique_draws[slot]:010d}"
                 simulated_id = f"{country_code}{network_code}{unique_digits}"
                 
-                # Determine device type based on frequency
-                freq_mhz = freq
-                device_type = 'Unknown'
-                
-                # Check if this is a UMTS frequency
-                if 1920 <= freq_mhz <= 1980 or 2110 <= freq_mhz <= 2170:  # UMTS Band 1
-                    device_type = 'UMTS'
-                elif 1850 <= freq_mhz <= 1910 or 1930 <= freq_mhz <= 1990:  # UMTS Band 2
-                    device_type = 'UMTS'
-                elif 1710 <= freq_mhz <= 1755 or 2110 <= freq_mhz <= 2155:  # UMTS Band 4
-                    device_type = 'UMTS'
-                elif 824 <= freq_mhz <= 849 or 869 <= freq_mhz <= 894:  # UMTS Band 5
-                    device_type = 'UMTS'
-                elif 880 <= freq_mhz <= 915 or 925 <= freq_mhz <= 960:  # UMTS Band 8
-                    device_type = 'UMTS'
-                # LTE bands
-                elif 699 <= freq_mhz <= 746:  # LTE Band 12, 13, 17
-                    device_type = 'LTE'
-                elif 2500 <= freq_mhz <= 2690:  # LTE Band 7
-                    device_type = 'LTE'
-                elif 2305 <= freq_mhz <= 2360:  # LTE Band 30
-                    device_type = 'LTE'
-                # GSM bands (if not already categorized)
-                elif 890 <= freq_mhz <= 960:  # GSM 900
-                    device_type = 'GSM'
-                elif 1710 <= freq_mhz <= 1880:  # GSM 1800
-                    device_type = 'GSM'
+                # Determine device type based on frequency: one indexed
+                # lookup in the precomputed MHz-granularity table instead
+                # of a ten-branch if/elif ladder per peak
+                mhz = int(freq)
+                if 0 <= mhz < len(_PEAK_TECH_TABLE) and _PEAK_TECH_TABLE[mhz]:
+                    device_type = str(_PEAK_TECH_TABLE[mhz])
                 else:
                     # If we can't determine, choose randomly but weighted
-                    device_type = random.choices(['GSM', 'UMTS', 'LTE'], weights=[0.2, 0.3, 0.5])[0]
+                    device_type = str(fallback_types[slot])
                 
                 device = {
                     'id': device_id,
@@ -366,44 +420,67 @@ class RFMonitor:
         
         return combined
 
+    def _writer_loop(self):
+        """Writer thread: serialize and flush queued snapshots to disk"""
+        while True:
+            filename, data = self._write_q.get()
+            try:
+                # orjson serializes NumPy arrays/scalars natively, so no
+                # recursive Python-level conversion pass is needed
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY))
+                print(f"Data saved to {filename}")
+            except Exception as e:
+                print(f"Error saving data: {str(e)}")
+            finally:
+                self._write_q.task_done()
+
     def save_data(self, data, filename='rf_data.json'):
-        """Save RF data to JSON file"""
+        """Queue RF data for the background writer thread"""
         try:
-            # Convert any NumPy types to native Python types first
-            def convert_numpy(obj):
-                if isinstance(obj, dict):
-                    return {k: convert_numpy(v) for k, v in obj.items()}
-                elif isinstance(obj, list):
-                    return [convert_numpy(item) for item in obj]
-                elif isinstance(obj, np.integer):
-                    return int(obj)
-                elif isinstance(obj, np.floating):
-                    return float(obj)
-                elif isinstance(obj, np.ndarray):
-                    return obj.tolist()
-                else:
-                    return obj
-            
-            # Convert data before serializing
-            converted_data = convert_numpy(data)
-            
-            with open(filename, 'w') as f:
-                json.dump(converted_data, f, cls=CustomJSONEncoder)
-            print(f"Data saved to {filename}")
-        except Exception as e:
-            print(f"Error saving data: {str(e)}")
+            self._write_q.put_nowait((filename, data))
+        except queue.Full:
+            # Drop the oldest pending snapshot so the newest data wins;
+            # a stalled disk should never stall the capture loop
+            try:
+                self._write_q.get_nowait()
+                self._write_q.task_done()  # Dropped items count as handled
+            except queue.Empty:
+                pass
+            try:
+                self._write_q.put_nowait((filename, data))
+            except queue.Full:
+                pass
+
+    def flush_writes(self):
+        """Block until every queued snapshot has been written to disk.
+
+        Writes are fire-and-forget on a daemon thread, so short-lived
+        callers (the one-shot CLI path) must flush before exiting or the
+        process can terminate with rf_data.json never written.
+        """
+        self._write_q.join()
 
     def plot_spectrum(self, frequencies, powers):
         """Plot the RF spectrum"""
-        plt.figure(figsize=(12, 6))
-        plt.plot(frequencies, powers)
-        plt.xlabel('Frequency (MHz)')
-        plt.ylabel('Power (dB)')
-        plt.title(f'RF Spectrum - Center: {self.center_freq/1e6:.2f} MHz')
-        plt.grid(True)
-        plt.tight_layout()
-        plt.savefig('spectrum.png')
-        plt.close()
+        # Reuse one Figure/Axes across snapshots: building and tearing
+        # down a fresh Agg canvas per plot costs tens of milliseconds,
+        # so only the line data and title change between calls
+        if self._fig is None:
+            self._fig, self._ax = plt.subplots(figsize=(12, 6))
+            self._line, = self._ax.plot([], [])
+            self._ax.set_xlabel('Frequency (MHz)')
+            self._ax.set_ylabel('Power (dB)')
+            self._ax.grid(True)
+            self._fig.tight_layout()
+        self._line.set_data(frequencies, powers)
+        # Title from the axis midpoint (MHz): the monitor's tuned
+        # frequency may have rotated since this spectrum was captured
+        center_mhz = frequencies[len(frequencies) // 2]
+        self._ax.set_title(f'RF Spectrum - Center: {center_mhz:.2f} MHz')
+        self._ax.relim()
+        self._ax.autoscale_view()
+        self._fig.savefig('spectrum.png')
 
 def main():
     try:
@@ -412,16 +489,20 @@ def main():
         rf_monitor = RFMonitor()
         
         print("\nCapturing RF data...")
-        samples = rf_monitor.capture_samples()
-        
-        if samples is not None:
+        capture = rf_monitor.capture_samples()
+
+        if capture is not None:
+            center_freq, samples = capture
             print(f"Captured {len(samples)} complex samples")
             print("Analyzing spectrum...")
-            spectrum_data = rf_monitor.analyze_spectrum(samples)
+            spectrum_data = rf_monitor.analyze_spectrum(samples, center_freq)
             
             if spectrum_data:
                 # Save the data
                 rf_monitor.save_data(spectrum_data)
+                # One-shot run: wait for the writer thread to finish so
+                # the process doesn't exit before the file lands on disk
+                rf_monitor.flush_writes()
                 
                 # Plot the spectrum
                 print("Plotting spectrum...")